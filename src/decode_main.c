@@ -2,15 +2,52 @@
  * Thin CLI wrapper around the decoder implementation. Keeping this file tiny
  * mirrors the generator's main.c: it only parses argv and hands control to the
  * library-style decode_wav function so the core logic stays reusable.
+ *
+ * With --batch, the wrapper reads one WAV path per line from a manifest file
+ * and decodes each in turn, printing a "File: <path>" line ahead of the usual
+ * decoder output. This lets the evaluation harness pay the process start-up
+ * cost once per batch instead of once per sample.
  */
 
 #include <stdio.h>
+#include <string.h>
 
 #include "decode.h"
 
+#define MANIFEST_LINE_MAX 4096
+
+static int decode_batch(const char *manifest_path) {
+    FILE *manifest = fopen(manifest_path, "r");
+    if (!manifest) {
+        fprintf(stderr, "Failed to open manifest: %s\n", manifest_path);
+        return 1;
+    }
+
+    char line[MANIFEST_LINE_MAX];
+    while (fgets(line, sizeof(line), manifest)) {
+        line[strcspn(line, "\r\n")] = '\0';
+        if (line[0] == '\0') {
+            continue;
+        }
+
+        printf("File: %s\n", line);
+        decode_wav(line);
+        /* Keep each file's output together if the decoder dies mid-batch. */
+        fflush(stdout);
+    }
+
+    fclose(manifest);
+    return 0;
+}
+
 int main(int argc, char **argv) {
+    if (argc == 3 && strcmp(argv[1], "--batch") == 0) {
+        return decode_batch(argv[2]);
+    }
+
     if (argc < 2) {
         printf("Usage: dtmf-decode <input.wav>\n");
+        printf("       dtmf-decode --batch <manifest.txt>\n");
         return 1;
     }
 
@@ -9,13 +9,23 @@ thresholds can be tuned from data instead of guesswork.
 
 from __future__ import annotations
 
-import csv
-import statistics
+import math
 import sys
 from pathlib import Path
 from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 HARMONICS_ROOT = Path("artifacts/harmonics")
+RATIO_COLUMNS = ["row2_ratio_db", "col2_ratio_db"]
 
 
 def normalize_code(token: str) -> str:
@@ -39,33 +49,42 @@ def parse_metadata(path: Path) -> Dict[str, str]:
     return {"code": code, "stem": stem}
 
 
-def percentile(values: Sequence[float], pct: float) -> float:
-    if not values:
-        return float("nan")
-    if len(values) == 1:
-        return values[0]
+def quantiles(arr: np.ndarray, fractions: Sequence[float]) -> List[float]:
+    # Same linear interpolation as np.quantile, but a single np.partition only
+    # places the ranks we need (O(N)) instead of sorting the whole bucket.
+    last = arr.size - 1
+    positions = [last * q for q in fractions]
+    lower = [int(pos) for pos in positions]
+    upper = [min(lo + 1, last) for lo in lower]
+    part = np.partition(arr, sorted(set(lower + upper)))
 
-    ordered = sorted(values)
-    k = (len(ordered) - 1) * pct / 100.0
-    lower = int(k)
-    upper = min(lower + 1, len(ordered) - 1)
-    weight = k - lower
-    return ordered[lower] * (1 - weight) + ordered[upper] * weight
+    return [
+        float(part[lo]) * (1 - (pos - lo)) + float(part[hi]) * (pos - lo)
+        for pos, lo, hi in zip(positions, lower, upper)
+    ]
 
 
-def compute_stats(values: List[float]) -> Dict[str, float]:
-    if not values:
+def compute_stats(arr: np.ndarray) -> Dict[str, float]:
+    if arr.size == 0:
         return {"count": 0}
 
+    # Sum and sum of squares give mean and population variance without a
+    # separate pass per statistic.
+    values = arr.astype(np.float64, copy=False)
+    count = values.size
+    mean = float(values.sum()) / count
+    variance = max(float(np.dot(values, values)) / count - mean * mean, 0.0)
+    p5, p50, p95 = quantiles(arr, [0.05, 0.5, 0.95])
+
     return {
-        "count": len(values),
-        "mean": statistics.fmean(values),
-        "stdev": statistics.pstdev(values),
-        "min": min(values),
-        "max": max(values),
-        "p5": percentile(values, 5),
-        "p50": percentile(values, 50),
-        "p95": percentile(values, 95),
+        "count": count,
+        "mean": mean,
+        "stdev": math.sqrt(variance),
+        "min": float(arr.min()),
+        "max": float(arr.max()),
+        "p5": p5,
+        "p50": p50,
+        "p95": p95,
     }
 
 
@@ -80,56 +99,68 @@ def format_stat_line(label: str, stats: Dict[str, float]) -> str:
     )
 
 
-def summarise_file(path: Path) -> Tuple[List[float], List[float], List[float], List[float]]:
+def read_ratio_frame(path: Path, columns: List[str]) -> pd.DataFrame:
+    options = {"usecols": columns, "on_bad_lines": "skip", "engine": CSV_ENGINE}
+    if CSV_ENGINE == "c":
+        # Without this the C engine takes an extra field on the first row as
+        # a sign that column 0 is the index and shifts every column left.
+        # pyarrow rejects the option.
+        options["index_col"] = False
+    dtypes = {column: "float32" if column in RATIO_COLUMNS else "str" for column in columns}
+    try:
+        df = pd.read_csv(path, dtype=dtypes, **options)
+    except ValueError:
+        # A non-numeric ratio cell: re-read as text (slow, one object per cell)
+        # and turn the unparseable cells into NaN.
+        df = pd.read_csv(path, dtype=str, **options)
+        df[RATIO_COLUMNS] = df[RATIO_COLUMNS].apply(pd.to_numeric, errors="coerce")
+
+    # Skip rows with a missing or non-numeric ratio instead of aborting the
+    # run or counting them as NaN. A last row cut short by a killed decoder
+    # ends up here on both engines. The engines still differ on a row with an
+    # extra field: pyarrow skips it, the C engine keeps it and drops the
+    # trailing field.
+    return df.dropna(subset=RATIO_COLUMNS)
+
+
+def summarise_file(
+    path: Path,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     meta = parse_metadata(path)
     has_code = bool(meta["code"])
 
-    digit_row2: List[float] = []
-    digit_col2: List[float] = []
-    noise_row2: List[float] = []
-    noise_col2: List[float] = []
-
     with path.open() as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                row2 = float(row["row2_ratio_db"])
-                col2 = float(row["col2_ratio_db"])
-            except (KeyError, ValueError):
-                continue
-
-            emitted = row.get("emitted_digit", "0")
-            is_digit_frame = emitted != "0" if has_code else False
+        header = f.readline().rstrip("\r\n").split(",")
+    if not all(column in header for column in RATIO_COLUMNS):
+        empty = np.empty(0, dtype=np.float32)
+        return empty, empty, empty, empty
+    has_emitted = "emitted_digit" in header
+
+    columns = [*RATIO_COLUMNS, "emitted_digit"] if has_emitted else RATIO_COLUMNS
+    df = read_ratio_frame(path, columns)
+    row2 = df["row2_ratio_db"].to_numpy(dtype=np.float32)
+    col2 = df["col2_ratio_db"].to_numpy(dtype=np.float32)
+
+    if has_code and has_emitted:
+        is_digit_frame = (df["emitted_digit"] != "0").to_numpy()
+    else:
+        is_digit_frame = np.zeros(len(df), dtype=bool)
+    is_noise_frame = ~is_digit_frame
 
-            if is_digit_frame:
-                digit_row2.append(row2)
-                digit_col2.append(col2)
-            else:
-                noise_row2.append(row2)
-                noise_col2.append(col2)
-
-    return digit_row2, digit_col2, noise_row2, noise_col2
+    return (
+        row2[is_digit_frame],
+        col2[is_digit_frame],
+        row2[is_noise_frame],
+        col2[is_noise_frame],
+    )
 
 
-def attach_col_stats(stats: Dict[str, float], col_values: List[float]) -> Dict[str, float]:
+def attach_col_stats(stats: Dict[str, float], col_arr: np.ndarray) -> Dict[str, float]:
     if not stats:
         stats = {"count": 0}
-    if not col_values:
-        stats.update({"col_count": 0})
-        return stats
-
-    stats.update(
-        {
-            "col_count": len(col_values),
-            "col_mean": statistics.fmean(col_values),
-            "col_stdev": statistics.pstdev(col_values),
-            "col_min": min(col_values),
-            "col_max": max(col_values),
-            "col_p5": percentile(col_values, 5),
-            "col_p50": percentile(col_values, 50),
-            "col_p95": percentile(col_values, 95),
-        }
-    )
+
+    col_stats = compute_stats(col_arr)
+    stats.update({f"col_{key}": value for key, value in col_stats.items()})
     return stats
 
 
@@ -143,10 +174,10 @@ def main() -> int:
         print(f"No CSV files found under {HARMONICS_ROOT}", file=sys.stderr)
         return 1
 
-    overall_digit_row2: List[float] = []
-    overall_digit_col2: List[float] = []
-    overall_noise_row2: List[float] = []
-    overall_noise_col2: List[float] = []
+    overall_digit_row2: List[np.ndarray] = []
+    overall_digit_col2: List[np.ndarray] = []
+    overall_noise_row2: List[np.ndarray] = []
+    overall_noise_col2: List[np.ndarray] = []
 
     for csv_path in csv_files:
         digit_row2, digit_col2, noise_row2, noise_col2 = summarise_file(csv_path)
@@ -159,15 +190,20 @@ def main() -> int:
         print(format_stat_line("non_digit_frames", noise_stats))
         print()
 
-        overall_digit_row2.extend(digit_row2)
-        overall_digit_col2.extend(digit_col2)
-        overall_noise_row2.extend(noise_row2)
-        overall_noise_col2.extend(noise_col2)
+        overall_digit_row2.append(digit_row2)
+        overall_digit_col2.append(digit_col2)
+        overall_noise_row2.append(noise_row2)
+        overall_noise_col2.append(noise_col2)
+
+    all_digit_row2 = np.concatenate(overall_digit_row2)
+    all_digit_col2 = np.concatenate(overall_digit_col2)
+    all_noise_row2 = np.concatenate(overall_noise_row2)
+    all_noise_col2 = np.concatenate(overall_noise_col2)
 
-    if overall_digit_row2 or overall_noise_row2:
+    if all_digit_row2.size or all_noise_row2.size:
         print("Overall:")
-        digit_stats = attach_col_stats(compute_stats(overall_digit_row2), overall_digit_col2)
-        noise_stats = attach_col_stats(compute_stats(overall_noise_row2), overall_noise_col2)
+        digit_stats = attach_col_stats(compute_stats(all_digit_row2), all_digit_col2)
+        noise_stats = attach_col_stats(compute_stats(all_noise_row2), all_noise_col2)
         print(format_stat_line("digit_frames", digit_stats))
         print(format_stat_line("non_digit_frames", noise_stats))
 
@@ -12,62 +12,61 @@ import math
 import random
 import sys
 import wave
-from array import array
 from pathlib import Path
 from typing import Tuple
 
+import numpy as np
 
-def read_pcm16_mono(path: Path) -> Tuple[int, array]:
+rng = np.random.default_rng()
+
+
+def read_pcm16_mono(path: Path) -> Tuple[int, np.ndarray]:
     with wave.open(str(path), "rb") as wf:
         if wf.getnchannels() != 1:
             raise ValueError(f"{path} is not mono")
         if wf.getsampwidth() != 2:
             raise ValueError(f"{path} is not 16-bit PCM")
         framerate = wf.getframerate()
-        data = array("h")
-        data.frombytes(wf.readframes(wf.getnframes()))
+        data = np.frombuffer(wf.readframes(wf.getnframes()), dtype="<i2")
     return framerate, data
 
 
-def write_pcm16_mono(path: Path, framerate: int, samples: array) -> None:
+def write_pcm16_mono(path: Path, framerate: int, samples: np.ndarray) -> None:
     with wave.open(str(path), "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(framerate)
-        wf.writeframes(samples.tobytes())
+        wf.writeframes(samples.astype("<i2", copy=False).tobytes())
 
 
-def rms(samples: array) -> float:
-    if not samples:
+def rms(samples: np.ndarray) -> float:
+    if samples.size == 0:
         return 0.0
-    acc = 0.0
-    for s in samples:
-        acc += float(s) * float(s)
-    return math.sqrt(acc / len(samples))
+    as_float = samples.astype(np.float64)
+    return math.sqrt(float(np.dot(as_float, as_float)) / samples.size)
 
 
-def clamp_int16(value: float) -> int:
-    return max(-32768, min(32767, int(round(value))))
+def fill_white(output: np.ndarray, start: int, end: int) -> None:
+    noise = rng.normal(0.0, 0.35 * 32767, size=end - start)
+    np.clip(np.rint(noise), -32768, 32767, out=noise)
+    output[start:end] = noise
 
 
-def build_noise_track(
-    length: int, framerate: int, mode: str, noise_source: array | None
-) -> array:
-    bursts = random.randint(2, 4)
-    output = array("h", [0] * length)
+def fill_from_source(output: np.ndarray, noise_source: np.ndarray, start: int, end: int) -> None:
+    src_len = noise_source.size
+    if src_len == 0:
+        return
+    # Copy whole passes of the source with slice assignment, wrapping as needed.
+    for pos in range(start, end, src_len):
+        count = min(src_len, end - pos)
+        output[pos : pos + count] = noise_source[:count]
 
-    def fill_white(start: int, end: int) -> None:
-        for i in range(start, end):
-            output[i] = clamp_int16(random.gauss(0, 0.35 * 32767))
 
-    def fill_from_source(start: int, end: int) -> None:
-        if not noise_source:
-            return
-        src_len = len(noise_source)
-        if src_len == 0:
-            return
-        for idx, pos in enumerate(range(start, end)):
-            output[pos] = noise_source[idx % src_len]
+def build_noise_track(
+    length: int, framerate: int, mode: str, noise_source: np.ndarray | None
+) -> np.ndarray:
+    bursts = random.randint(2, 4)
+    output = np.zeros(length, dtype=np.int16)
 
     for _ in range(bursts):
         dur_ms = random.randint(200, 400)
@@ -77,9 +76,9 @@ def build_noise_track(
         start = random.randint(0, length - dur_samples)
         end = start + dur_samples
         if mode == "white":
-            fill_white(start, end)
-        else:
-            fill_from_source(start, end)
+            fill_white(output, start, end)
+        elif noise_source is not None:
+            fill_from_source(output, noise_source, start, end)
 
     return output
 
@@ -88,7 +87,7 @@ def mix_bursty_noise(
     base_path: Path, out_path: Path, snr_db: float, noise_mode: str, noise_path: Path | None
 ) -> None:
     framerate, base_samples = read_pcm16_mono(base_path)
-    noise_source: array | None = None
+    noise_source: np.ndarray | None = None
     if noise_mode != "white":
         if noise_path is None:
             raise ValueError("noise_path is required for non-white noise")
@@ -112,12 +111,15 @@ def mix_bursty_noise(
     target_noise_rms = base_rms / (10 ** (snr_db / 20))
     scale = target_noise_rms / noise_rms
 
-    mixed = array("h")
-    for b, n in zip(base_samples, noise_track):
-        mixed.append(clamp_int16(float(b) + float(n) * scale))
+    # Scale the noise once, then add, round and clip in place on the same buffer.
+    mixed = noise_track.astype(np.float32)
+    mixed *= scale
+    mixed += base_samples
+    np.rint(mixed, out=mixed)
+    np.clip(mixed, -32768, 32767, out=mixed)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    write_pcm16_mono(out_path, framerate, mixed)
+    write_pcm16_mono(out_path, framerate, mixed.astype(np.int16))
 
 
 def main() -> None:
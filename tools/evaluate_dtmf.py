@@ -16,18 +16,20 @@ regressions are caught early.
 from __future__ import annotations
 
 import csv
+import os
 import subprocess
 import sys
-from dataclasses import dataclass
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 TEST_ROOT = Path("artifacts/wav/tests")
 REPORT_PATH = Path("artifacts/wav/report.csv")
+DECODER = "bin/dtmf-decode"
 
 
-@dataclass
-class SampleMetadata:
+class SampleMetadata(NamedTuple):
     path: Path
     condition: str
     code: str
@@ -35,8 +37,7 @@ class SampleMetadata:
     noise_type: Optional[str]
 
 
-@dataclass
-class SampleResult:
+class SampleResult(NamedTuple):
     filename: str
     condition: str
     code: str
@@ -96,7 +97,7 @@ def parse_decoder_output(output: str) -> str:
 
 def decode_sample(path: Path) -> Tuple[str, str]:
     proc = subprocess.run(
-        ["bin/dtmf-decode", str(path)],
+        [DECODER, str(path)],
         capture_output=True,
         text=True,
         check=False,
@@ -109,6 +110,39 @@ def decode_sample(path: Path) -> Tuple[str, str]:
     return decoded, notes
 
 
+def decode_batch(paths: List[Path]) -> Dict[Path, Tuple[str, str]]:
+    """Decode many WAVs with one decoder process via its --batch manifest mode.
+
+    Any file missing from the batch output (older decoder without --batch, or
+    a decoder crash part way through) is decoded individually instead.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as manifest:
+        manifest.writelines(f"{path}\n" for path in paths)
+    try:
+        proc = subprocess.run(
+            [DECODER, "--batch", manifest.name],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    finally:
+        os.unlink(manifest.name)
+
+    # Each file's usual decoder output follows its "File: <path>" line.
+    batch_output: Dict[str, str] = {}
+    for block in ("\n" + (proc.stdout or "")).split("\nFile: ")[1:]:
+        name, _, output = block.partition("\n")
+        batch_output[name] = output
+
+    results: Dict[Path, Tuple[str, str]] = {}
+    for path in paths:
+        if str(path) in batch_output:
+            results[path] = (parse_decoder_output(batch_output[str(path)]), "")
+        else:
+            results[path] = decode_sample(path)
+    return results
+
+
 def classify_error(expected: str, decoded: str) -> str:
     if expected == decoded:
         return ""
@@ -123,6 +157,30 @@ def classify_error(expected: str, decoded: str) -> str:
     return "wrong digits"
 
 
+def process_one(path: Path, decoded: str, notes: str) -> SampleResult:
+    meta = parse_metadata(path)
+    expected_code = meta.code
+
+    error_type = classify_error(expected_code, decoded)
+
+    if meta.noise_type:
+        if notes:
+            notes = f"{notes}; noise={meta.noise_type}"
+        else:
+            notes = f"noise={meta.noise_type}"
+
+    return SampleResult(
+        filename=str(path.relative_to(TEST_ROOT)),
+        condition=meta.condition,
+        code=expected_code,
+        snr=meta.snr,
+        decoded_code=decoded,
+        success=error_type == "",
+        error_type=error_type,
+        notes=notes,
+    )
+
+
 def record_stats(
     stats: Dict[str, Dict[str, int]], condition: str, snr: Optional[str], success: bool
 ) -> None:
@@ -166,19 +224,19 @@ def write_csv(results: List[SampleResult]) -> None:
             "error_type",
             "notes",
         ])
-        for res in results:
-            writer.writerow(
-                [
-                    res.filename,
-                    res.condition,
-                    res.code if res.code else "NONE",
-                    res.snr or "",
-                    res.decoded_code if res.decoded_code else "NONE",
-                    "yes" if res.success else "no",
-                    res.error_type,
-                    res.notes,
-                ]
-            )
+        writer.writerows(
+            [
+                res.filename,
+                res.condition,
+                res.code if res.code else "NONE",
+                res.snr or "",
+                res.decoded_code if res.decoded_code else "NONE",
+                "yes" if res.success else "no",
+                res.error_type,
+                res.notes,
+            ]
+            for res in results
+        )
 
 
 def main() -> int:
@@ -191,41 +249,25 @@ def main() -> int:
         print(f"No WAV files found under {TEST_ROOT}", file=sys.stderr)
         return 1
 
-    results: List[SampleResult] = []
-    stats: Dict[str, Dict[str, int]] = {}
-    clean_failure = False
+    # Split the samples into one batch per core; each batch is a single decoder
+    # process, and the threads only wait on those children.
+    workers = os.cpu_count() or 1
+    batches = [wav_files[i::workers] for i in range(min(workers, len(wav_files)))]
+    decoded: Dict[Path, Tuple[str, str]] = {}
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        for batch_decoded in executor.map(decode_batch, batches):
+            decoded.update(batch_decoded)
 
-    for path in wav_files:
-        meta = parse_metadata(path)
-        expected_code = meta.code
+    results = [process_one(path, *decoded[path]) for path in wav_files]
 
-        decoded, notes = decode_sample(path)
-        error_type = classify_error(expected_code, decoded)
-        success = error_type == ""
+    stats: Dict[str, Dict[str, int]] = {}
+    clean_failure = False
 
-        if meta.condition == "clean" and not success:
+    for res in results:
+        if res.condition == "clean" and not res.success:
             clean_failure = True
 
-        record_stats(stats, meta.condition, meta.snr, success)
-
-        if meta.noise_type:
-            if notes:
-                notes = f"{notes}; noise={meta.noise_type}"
-            else:
-                notes = f"noise={meta.noise_type}"
-
-        results.append(
-            SampleResult(
-                filename=str(path.relative_to(TEST_ROOT)),
-                condition=meta.condition,
-                code=expected_code,
-                snr=meta.snr,
-                decoded_code=decoded,
-                success=success,
-                error_type=error_type,
-                notes=notes,
-            )
-        )
+        record_stats(stats, res.condition, res.snr, res.success)
 
     write_csv(results)
 
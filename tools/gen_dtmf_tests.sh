@@ -22,6 +22,12 @@ JITTER_GAPS=(60 100 250 400)
 OFFSET_SILENCE_MAX=1000
 BURST_SILENCE_MS=500
 
+# The bursty overlays below run with `|| true`; fail here rather than skip them.
+if ! python3 -c "import numpy" 2>/dev/null; then
+    echo "error: tools/bursty_noise_overlay.py needs NumPy (pip install numpy)" >&2
+    exit 1
+fi
+
 mkdir -p "${OUTPUT_DIR}"
 
 sanitize_code() {
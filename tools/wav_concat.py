@@ -9,45 +9,146 @@ additional tooling.
 from __future__ import annotations
 
 import argparse
-import wave
+import os
+import struct
 from pathlib import Path
+from typing import BinaryIO, Tuple
+
+# Bytes copied per read/write call when the kernel cannot copy for us.
+CHUNK_BYTES = 1 << 20
+
+WAVE_FORMAT_PCM = 1
+WAV_HEADER_SIZE = 44
+
+
+def read_wav_layout(path: Path) -> Tuple[Tuple[int, int, int], int, int]:
+    """Return ((nchannels, sampwidth, framerate), data_offset, data_size)."""
+    with path.open("rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            raise ValueError(f"{path} is not a RIFF/WAVE file")
+
+        params = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+
+            if chunk_id == b"fmt ":
+                fmt = f.read(chunk_size)
+                if len(fmt) < 16:
+                    raise ValueError(f"{path} has a truncated fmt chunk")
+                format_tag, nchannels, framerate, _, _, bits = struct.unpack_from(
+                    "<HHIIHH", fmt
+                )
+                if nchannels != 1:
+                    raise ValueError(f"{path} is not mono")
+                if format_tag != WAVE_FORMAT_PCM or bits != 16:
+                    raise ValueError(f"{path} is not 16-bit PCM")
+                params = (nchannels, bits // 8, framerate)
+            elif chunk_id == b"data":
+                if params is None:
+                    raise ValueError(f"{path} has a data chunk before its fmt chunk")
+                data_offset = f.tell()
+                # Streaming writers may leave an oversized length; trust the file.
+                available = os.fstat(f.fileno()).st_size - data_offset
+                data_size = min(chunk_size, available)
+                data_size -= data_size % (params[0] * params[1])
+                return params, data_offset, data_size
+            else:
+                f.seek(chunk_size, os.SEEK_CUR)
+
+            # RIFF chunks are word aligned.
+            if chunk_size & 1:
+                f.seek(1, os.SEEK_CUR)
+
+
+def wav_header(params: Tuple[int, int, int], data_size: int) -> bytes:
+    nchannels, sampwidth, framerate = params
+    block_align = nchannels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        WAV_HEADER_SIZE - 8 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        WAVE_FORMAT_PCM,
+        nchannels,
+        framerate,
+        framerate * block_align,
+        block_align,
+        sampwidth * 8,
+        b"data",
+        data_size,
+    )
+
+
+def write_all(dst: BinaryIO, data: bytes) -> None:
+    # dst is unbuffered, so a single write() may accept only part of the data.
+    view = memoryview(data)
+    while view:
+        written = dst.write(view)
+        view = view[written:]
+
+
+def copy_payload(src: BinaryIO, dst: BinaryIO, offset: int, size: int) -> int:
+    copied = 0
+    if hasattr(os, "sendfile"):
+        try:
+            while copied < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset + copied, size - copied)
+                if sent == 0:
+                    return copied
+                copied += sent
+            return copied
+        except OSError:
+            # e.g. macOS only sends to sockets; finish with a buffered copy.
+            pass
+
+    src.seek(offset + copied)
+    while copied < size:
+        chunk = src.read(min(CHUNK_BYTES, size - copied))
+        if not chunk:
+            break
+        write_all(dst, chunk)
+        copied += len(chunk)
+    return copied
 
 
 def concat_wavs(output: Path, inputs: list[Path]) -> None:
     if not inputs:
         raise ValueError("No input WAVs provided")
+    # Opening the output truncates it before its payload could be copied.
+    if any(output.resolve() == path.resolve() for path in inputs):
+        raise ValueError(f"Output {output} is also one of the inputs")
 
     params = None
-    frames: list[bytes] = []
+    layouts: list[Tuple[int, int]] = []
     for path in inputs:
-        with wave.open(str(path), "rb") as wf:
-            if wf.getnchannels() != 1:
-                raise ValueError(f"{path} is not mono")
-            if wf.getsampwidth() != 2:
-                raise ValueError(f"{path} is not 16-bit PCM")
-            current_params = (
-                wf.getnchannels(),
-                wf.getsampwidth(),
-                wf.getframerate(),
+        current_params, data_offset, data_size = read_wav_layout(path)
+        if params is None:
+            params = current_params
+        elif params != current_params:
+            raise ValueError(
+                f"Input format mismatch: {current_params} does not match {params}"
             )
-            if params is None:
-                params = current_params
-            elif params != current_params:
-                raise ValueError(
-                    f"Input format mismatch: {current_params} does not match {params}"
-                )
-            frames.append(wf.readframes(wf.getnframes()))
+        layouts.append((data_offset, data_size))
 
     assert params is not None
-    nchannels, sampwidth, framerate = params
 
     output.parent.mkdir(parents=True, exist_ok=True)
-    with wave.open(str(output), "wb") as out:
-        out.setnchannels(nchannels)
-        out.setsampwidth(sampwidth)
-        out.setframerate(framerate)
-        for chunk in frames:
-            out.writeframes(chunk)
+    # Unbuffered so os.sendfile and plain writes share one file position.
+    with output.open("wb", buffering=0) as out:
+        write_all(out, wav_header(params, 0))
+        total = 0
+        for path, (data_offset, data_size) in zip(inputs, layouts):
+            with path.open("rb", buffering=0) as src:
+                total += copy_payload(src, out, data_offset, data_size)
+
+        out.seek(0)
+        write_all(out, wav_header(params, total))
 
 
 def main() -> None: